@@ -8,11 +8,17 @@ them to Markdown using the MarkItDown library with optional LLM-powered image de
 
 import argparse
 import logging
+import multiprocessing
 import os
+import sqlite3
 import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
 
 from dotenv import load_dotenv
 from markitdown import MarkItDown
@@ -21,28 +27,114 @@ from tqdm import tqdm
 # Load environment variables from .env file
 load_dotenv()
 
+
+class TqdmLoggingHandler(logging.Handler):
+    """Logging handler that writes through tqdm so progress bars stay intact."""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            tqdm.write(self.format(record), file=sys.stdout)
+        except Exception:
+            self.handleError(record)
+
+
 # Configure logging
 LOG_FILE = 'conversion_errors.log'
+CACHE_FILE = '.markitdown_cache.sqlite'
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
     handlers=[
         logging.FileHandler(LOG_FILE),
-        logging.StreamHandler(sys.stdout)
+        TqdmLoggingHandler()
     ]
 )
 logger = logging.getLogger(__name__)
 
+# MarkItDown instance used by pool workers; inherited from the parent when
+# workers are forked, otherwise set by _init_worker in each worker
+_worker_md = None
+
+# Unicode characters and their basic ASCII equivalents
+_ASCII_REPLACEMENTS = {
+    # Curly quotes to straight quotes
+    '\u2018': "'",  # Left single quotation mark
+    '\u2019': "'",  # Right single quotation mark
+    '\u201A': "'",  # Single low-9 quotation mark
+    '\u201B': "'",  # Single high-reversed-9 quotation mark
+    '\u201C': '"',  # Left double quotation mark
+    '\u201D': '"',  # Right double quotation mark
+    '\u201E': '"',  # Double low-9 quotation mark
+    '\u201F': '"',  # Double high-reversed-9 quotation mark
+    # Dashes
+    '\u2013': '-',  # En dash
+    '\u2014': '--', # Em dash
+    '\u2015': '--', # Horizontal bar
+    # Spaces
+    '\u00A0': ' ',  # Non-breaking space
+    '\u2000': ' ',  # En quad
+    '\u2001': ' ',  # Em quad
+    '\u2002': ' ',  # En space
+    '\u2003': ' ',  # Em space
+    '\u2004': ' ',  # Three-per-em space
+    '\u2005': ' ',  # Four-per-em space
+    '\u2006': ' ',  # Six-per-em space
+    '\u2007': ' ',  # Figure space
+    '\u2008': ' ',  # Punctuation space
+    '\u2009': ' ',  # Thin space
+    '\u200A': ' ',  # Hair space
+    # Other punctuation
+    '\u2026': '...', # Horizontal ellipsis
+    '\u2022': '*',   # Bullet
+    '\u2023': '>',   # Triangular bullet
+    '\u2032': "'",   # Prime
+    '\u2033': '"',   # Double prime
+    '\u2035': "'",   # Reversed prime
+    '\u2036': '"',   # Reversed double prime
+}
+
+# Translation table built once so normalization is a single pass over the text
+_TRANSLATE_TABLE = str.maketrans(_ASCII_REPLACEMENTS)
+
+
+def limit_concurrency(client, max_concurrent: int):
+    """
+    Bound the number of in-flight chat completion requests on an OpenAI client.
+
+    MarkItDown requests one image description at a time and uses each result
+    immediately, so requests cannot be batched within a document. Concurrency
+    comes from converting several documents at once on a shared client; this
+    caps it to stay within per-organization rate limits.
+
+    Args:
+        client: OpenAI client instance
+        max_concurrent: Maximum number of simultaneous requests
+
+    Returns:
+        The same client, with chat.completions.create wrapped
+    """
+    semaphore = threading.BoundedSemaphore(max(1, max_concurrent))
+    create = client.chat.completions.create
 
-def setup_markitdown(use_llm: bool = True) -> MarkItDown:
+    def bounded_create(*args, **kwargs):
+        with semaphore:
+            return create(*args, **kwargs)
+
+    client.chat.completions.create = bounded_create
+    return client
+
+
+def setup_markitdown(use_llm: bool = True, llm_concurrency: int = 8) -> Tuple[MarkItDown, bool]:
     """
     Initialize the MarkItDown converter with optional LLM integration.
 
     Args:
         use_llm: Whether to enable LLM-powered image descriptions
+        llm_concurrency: Maximum number of simultaneous OpenAI requests
 
     Returns:
-        Configured MarkItDown instance
+        Tuple of the configured MarkItDown instance and whether an LLM client
+        was attached to it
     """
     if use_llm:
         api_key = os.getenv('OPENAI_API_KEY')
@@ -51,20 +143,20 @@ def setup_markitdown(use_llm: bool = True) -> MarkItDown:
         if not api_key:
             logger.warning("OPENAI_API_KEY not found in environment. Image descriptions will be disabled.")
             logger.warning("To enable, copy .env to .env and add your API key.")
-            return MarkItDown(enable_plugins=False)
+            return MarkItDown(enable_plugins=False), False
 
         try:
             from openai import OpenAI
-            client = OpenAI(api_key=api_key)
+            client = limit_concurrency(OpenAI(api_key=api_key), llm_concurrency)
             logger.info(f"LLM integration enabled using model: {model}")
-            return MarkItDown(llm_client=client, llm_model=model)
+            return MarkItDown(llm_client=client, llm_model=model), True
         except Exception as e:
             logger.error(f"Failed to initialize OpenAI client: {e}")
             logger.warning("Falling back to conversion without LLM features.")
-            return MarkItDown(enable_plugins=False)
+            return MarkItDown(enable_plugins=False), False
     else:
         logger.info("LLM integration disabled.")
-        return MarkItDown(enable_plugins=False)
+        return MarkItDown(enable_plugins=False), False
 
 
 def find_office_files(directory: Path, extensions: Tuple[str, ...] = ('.docx', '.pptx')) -> List[Path]:
@@ -78,14 +170,30 @@ def find_office_files(directory: Path, extensions: Tuple[str, ...] = ('.docx', '
     Returns:
         List of Path objects for found files
     """
+    # Walk the tree once, matching all extensions per entry
     files = []
-    for ext in extensions:
-        files.extend(directory.rglob(f'*{ext}'))
+    stack = [str(directory)]
+    while stack:
+        # Skip directories that cannot be read, as Path.rglob does
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
 
-    # Filter out temporary Office files (start with ~$)
-    files = [f for f in files if not f.name.startswith('~$')]
+        with it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
 
-    return sorted(files)
+                if is_dir:
+                    stack.append(entry.path)
+                # Filter out temporary Office files (start with ~$)
+                elif entry.name.endswith(extensions) and not entry.name.startswith('~$'):
+                    files.append(entry.path)
+
+    return [Path(f) for f in sorted(files)]
 
 
 def normalize_to_ascii(text: str) -> str:
@@ -98,49 +206,11 @@ def normalize_to_ascii(text: str) -> str:
     Returns:
         Text with Unicode characters replaced by ASCII equivalents
     """
-    # Define character replacements
-    replacements = {
-        # Curly quotes to straight quotes
-        '\u2018': "'",  # Left single quotation mark
-        '\u2019': "'",  # Right single quotation mark
-        '\u201A': "'",  # Single low-9 quotation mark
-        '\u201B': "'",  # Single high-reversed-9 quotation mark
-        '\u201C': '"',  # Left double quotation mark
-        '\u201D': '"',  # Right double quotation mark
-        '\u201E': '"',  # Double low-9 quotation mark
-        '\u201F': '"',  # Double high-reversed-9 quotation mark
-        # Dashes
-        '\u2013': '-',  # En dash
-        '\u2014': '--', # Em dash
-        '\u2015': '--', # Horizontal bar
-        # Spaces
-        '\u00A0': ' ',  # Non-breaking space
-        '\u2000': ' ',  # En quad
-        '\u2001': ' ',  # Em quad
-        '\u2002': ' ',  # En space
-        '\u2003': ' ',  # Em space
-        '\u2004': ' ',  # Three-per-em space
-        '\u2005': ' ',  # Four-per-em space
-        '\u2006': ' ',  # Six-per-em space
-        '\u2007': ' ',  # Figure space
-        '\u2008': ' ',  # Punctuation space
-        '\u2009': ' ',  # Thin space
-        '\u200A': ' ',  # Hair space
-        # Other punctuation
-        '\u2026': '...', # Horizontal ellipsis
-        '\u2022': '*',   # Bullet
-        '\u2023': '>',   # Triangular bullet
-        '\u2032': "'",   # Prime
-        '\u2033': '"',   # Double prime
-        '\u2035': "'",   # Reversed prime
-        '\u2036': '"',   # Reversed double prime
-    }
-
-    # Apply replacements
-    for unicode_char, ascii_char in replacements.items():
-        text = text.replace(unicode_char, ascii_char)
-
-    return text
+    # Pure ASCII text has nothing to replace; the check is O(1) in CPython
+    if text.isascii():
+        return text
+
+    return text.translate(_TRANSLATE_TABLE)
 
 
 def convert_file(md: MarkItDown, input_file: Path, output_file: Path) -> bool:
@@ -156,24 +226,213 @@ def convert_file(md: MarkItDown, input_file: Path, output_file: Path) -> bool:
         True if conversion successful, False otherwise
     """
     try:
-        logger.info(f"Converting: {input_file}")
+        logger.info("Converting: %s", input_file)
         result = md.convert(str(input_file))
 
-        # Normalize Unicode characters to ASCII
-        normalized_content = normalize_to_ascii(result.text_content)
+        # Normalize Unicode characters to ASCII and write the Markdown in one
+        # buffered write, without holding a second named copy of the content
+        with open(output_file, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            f.write(normalize_to_ascii(result.text_content))
 
-        # Write the converted Markdown to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(normalized_content)
-
-        logger.info(f"Successfully converted to: {output_file}")
+        logger.info("Successfully converted to: %s", output_file)
         return True
 
     except Exception as e:
-        logger.error(f"Failed to convert {input_file}: {str(e)}")
+        logger.error("Failed to convert %s: %s", input_file, e)
         return False
 
 
+def prefetch_file(input_file: Path) -> None:
+    """
+    Ask the OS to start reading a file into the page cache before it is converted.
+
+    This is a hint only; it does nothing on platforms without posix_fadvise.
+
+    Args:
+        input_file: Path to input file
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        return
+
+    try:
+        fd = os.open(input_file, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def open_cache(cache_path: Path) -> sqlite3.Connection:
+    """
+    Open the conversion cache, creating it if needed.
+
+    Args:
+        cache_path: Path to the SQLite cache file
+
+    Returns:
+        Open SQLite connection in autocommit mode
+    """
+    conn = sqlite3.connect(cache_path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS conv "
+        "(path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, use_llm INTEGER)"
+    )
+
+    # Caches created before the mode was recorded have no use_llm column; their
+    # rows never match, so those files are reconverted once
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(conv)")}
+    if 'use_llm' not in columns:
+        conn.execute("ALTER TABLE conv ADD COLUMN use_llm INTEGER")
+
+    return conn
+
+
+def is_unchanged(conn: sqlite3.Connection, input_file: Path, stat: os.stat_result,
+                 use_llm: bool) -> bool:
+    """
+    Check whether a file matches its last successful conversion.
+
+    Args:
+        conn: Cache connection
+        input_file: Path to input file
+        stat: Current stat result of the input file
+        use_llm: Whether LLM-powered image descriptions are active for this run
+
+    Returns:
+        True if the cached modification time, size and LLM mode match, False otherwise
+    """
+    row = conn.execute(
+        "SELECT mtime, size, use_llm FROM conv WHERE path = ?", (str(input_file),)
+    ).fetchone()
+    return row == (stat.st_mtime_ns, stat.st_size, int(use_llm))
+
+
+def record_conversion(conn: sqlite3.Connection, input_file: Path, stat: os.stat_result,
+                      use_llm: bool) -> None:
+    """
+    Record a successful conversion in the cache.
+
+    Args:
+        conn: Cache connection
+        input_file: Path to input file
+        stat: Stat result of the input file taken before conversion
+        use_llm: Whether the file was converted with LLM-powered image descriptions
+    """
+    conn.execute(
+        "INSERT OR REPLACE INTO conv (path, mtime, size, use_llm) VALUES (?, ?, ?, ?)",
+        (str(input_file), stat.st_mtime_ns, stat.st_size, int(use_llm))
+    )
+
+
+def partition_unchanged(conn: Optional[sqlite3.Connection], files: List[Path], use_llm: bool
+                        ) -> Tuple[List[Path], Dict[Path, os.stat_result], List[Path]]:
+    """
+    Split files into those to convert and those unchanged since their last conversion.
+
+    Args:
+        conn: Cache connection, or None to treat every file as changed
+        files: Files found by the scan
+        use_llm: Whether LLM-powered image descriptions are active for this run
+
+    Returns:
+        Tuple of files to convert, their stat results, and unchanged files.
+        Files that cannot be stat'ed (dangling symlinks, files removed since the
+        scan) are returned for conversion without a stat result, so the
+        conversion reports them as failed.
+    """
+    pending = []
+    file_stats = {}
+    unchanged = []
+    for input_file in files:
+        try:
+            stat = input_file.stat()
+        except OSError:
+            pending.append(input_file)
+            continue
+
+        if (conn is not None and input_file.with_suffix('.md').exists()
+                and is_unchanged(conn, input_file, stat, use_llm)):
+            unchanged.append(input_file)
+        else:
+            pending.append(input_file)
+            file_stats[input_file] = stat
+
+    return pending, file_stats, unchanged
+
+
+def _init_worker(log_queue: multiprocessing.Queue, build_converter: bool) -> None:
+    """
+    Initialize a pool worker process.
+
+    Log records are forwarded to the parent, which owns the console and log
+    file, so worker output does not break the progress bar. When workers are
+    not forked, each also builds its own converter, since MarkItDown instances
+    are not picklable.
+
+    Args:
+        log_queue: Queue read by the parent's log listener
+        build_converter: Whether to create this worker's MarkItDown instance
+    """
+    global _worker_md
+    logging.getLogger().handlers = [QueueHandler(log_queue)]
+
+    if build_converter:
+        _worker_md, _ = setup_markitdown(use_llm=False)
+
+
+def _convert_one(input_path: str) -> bool:
+    """
+    Convert a single file using the worker's MarkItDown instance.
+
+    Args:
+        input_path: Path to input file
+
+    Returns:
+        True if conversion successful, False otherwise
+    """
+    input_file = Path(input_path)
+    return convert_file(_worker_md, input_file, input_file.with_suffix('.md'))
+
+
+def create_process_pool(workers: int, log_queue: multiprocessing.Queue,
+                        md: Optional[MarkItDown] = None) -> ProcessPoolExecutor:
+    """
+    Create a process pool for conversion without LLM image descriptions.
+
+    On Linux, workers are forked and inherit the parent's converter
+    copy-on-write. Elsewhere, each worker builds its own.
+
+    Args:
+        workers: Number of worker processes
+        log_queue: Queue that workers send their log records to
+        md: Existing MarkItDown instance to share with forked workers; one is
+            created if not given
+
+    Returns:
+        Process pool executor
+    """
+    global _worker_md
+
+    if sys.platform.startswith('linux'):
+        _worker_md = md if md is not None else setup_markitdown(use_llm=False)[0]
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('fork'),
+            initializer=_init_worker,
+            initargs=(log_queue, False)
+        )
+
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(log_queue, True)
+    )
+
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -185,6 +444,9 @@ Examples:
   %(prog)s --directory ./documents            # Convert files in specific directory
   %(prog)s --skip-images                      # Convert without LLM image descriptions
   %(prog)s --directory ./docs --extensions .docx  # Convert only Word documents
+  %(prog)s --workers 4                        # Convert using 4 worker processes
+  %(prog)s --force                            # Reconvert files even if unchanged
+  %(prog)s --dry-run                          # List files without converting them
         """
     )
 
@@ -208,6 +470,46 @@ Examples:
         help='File extensions to convert (default: .docx .pptx)'
     )
 
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=max(1, (os.cpu_count() or 1) - 1),
+        help='Number of parallel worker processes (default: CPU count minus one)'
+    )
+
+    parser.add_argument(
+        '--llm-workers',
+        type=int,
+        default=16,
+        help='Number of worker threads when LLM image descriptions are enabled (default: 16)'
+    )
+
+    parser.add_argument(
+        '--llm-concurrency',
+        type=int,
+        default=8,
+        help='Maximum number of simultaneous OpenAI requests (default: 8)'
+    )
+
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Reconvert all files, ignoring the conversion cache'
+    )
+
+    parser.add_argument(
+        '--dry-run',
+        action='store_true',
+        help='List the files that would be converted without converting them'
+    )
+
+    parser.add_argument(
+        '--prefetch',
+        type=int,
+        default=8,
+        help='Number of upcoming files to read ahead into the page cache, 0 to disable (default: 8)'
+    )
+
     args = parser.parse_args()
 
     # Validate directory
@@ -228,8 +530,6 @@ Examples:
     logger.info(f"Searching directory: {directory}")
     logger.info(f"File extensions: {', '.join(args.extensions)}")
 
-    md = setup_markitdown(use_llm=not args.skip_images)
-
     # Find all Office files
     logger.info("Scanning for files...")
     extensions = tuple(ext if ext.startswith('.') else f'.{ext}' for ext in args.extensions)
@@ -239,33 +539,168 @@ Examples:
         logger.warning(f"No files with extensions {extensions} found in {directory}")
         sys.exit(0)
 
-    logger.info(f"Found {len(files)} file(s) to convert")
+    logger.info(f"Found {len(files)} file(s)")
+
+    # List the files and stop before setting up the converter. The cache is
+    # only read, and the LLM mode is estimated from the API key so no OpenAI
+    # client is created
+    if args.dry_run:
+        pending, unchanged = files, []
+        cache_path = directory / CACHE_FILE
+        if not args.force and cache_path.exists():
+            use_llm = not args.skip_images and bool(os.getenv('OPENAI_API_KEY'))
+            conn = sqlite3.connect(f"{cache_path.as_uri()}?mode=ro", uri=True)
+            try:
+                pending, _, unchanged = partition_unchanged(conn, files, use_llm)
+            except sqlite3.Error:
+                # Unreadable or outdated cache; a real run would convert everything
+                pass
+            finally:
+                conn.close()
+
+        logger.info(f"Would convert {len(pending)} file(s):")
+        for input_file in pending:
+            logger.info(f"  {input_file}")
+
+        if unchanged:
+            logger.info(f"Would skip {len(unchanged)} unchanged file(s):")
+            for input_file in unchanged:
+                logger.info(f"  {input_file}")
+
+        logger.info("Dry run: no files were converted")
+        sys.exit(0)
+
+    # Set up the LLM converter up front: without an API key or a working
+    # client it falls back to plain conversion, which is CPU-bound
+    md = None
+    use_llm = False
+    if not args.skip_images:
+        md, use_llm = setup_markitdown(use_llm=True, llm_concurrency=args.llm_concurrency)
+
+    # Skip files that are unchanged since their last successful conversion
+    cache = open_cache(directory / CACHE_FILE)
+    pending, file_stats, unchanged = partition_unchanged(
+        None if args.force else cache, files, use_llm
+    )
+    skipped = len(unchanged)
+
+    if skipped:
+        logger.info(f"Skipping {skipped} unchanged file(s) (use --force to reconvert)")
 
     # Convert files with progress bar
     successful = 0
     failed = 0
 
-    with tqdm(total=len(files), desc="Converting files", unit="file") as pbar:
-        for input_file in files:
-            # Create output filename (same location, .md extension)
-            output_file = input_file.with_suffix('.md')
+    # LLM conversions are bound by OpenAI API latency, so threads sharing one
+    # MarkItDown instance overlap the requests; otherwise parsing is CPU-bound
+    workers = max(1, args.llm_workers if use_llm else args.workers)
+
+    # Files are read ahead in conversion order so disk reads overlap parsing
+    prefetch = max(0, args.prefetch)
+    to_prefetch = iter(pending if prefetch else [])
+
+    if not pending:
+        logger.info("All files are up to date")
+    elif len(pending) == 1 or workers == 1:
+        if md is None:
+            md, _ = setup_markitdown(use_llm=False)
+
+        for f in islice(to_prefetch, prefetch):
+            prefetch_file(f)
 
-            # Update progress bar description
-            pbar.set_description(f"Converting {input_file.name}")
+        with tqdm(total=len(pending), desc="Converting files", unit="file",
+                  mininterval=0.2, miniters=1, smoothing=0.1) as pbar:
+            for input_file in pending:
+                for f in islice(to_prefetch, 1):
+                    prefetch_file(f)
 
-            # Convert file
-            if convert_file(md, input_file, output_file):
-                successful += 1
-            else:
-                failed += 1
+                # Create output filename (same location, .md extension)
+                output_file = input_file.with_suffix('.md')
 
-            pbar.update(1)
+                # Show the current file without forcing a redraw
+                pbar.set_postfix_str(input_file.name, refresh=False)
+
+                # Convert file
+                if convert_file(md, input_file, output_file):
+                    if input_file in file_stats:
+                        record_conversion(cache, input_file, file_stats[input_file], use_llm)
+                    successful += 1
+                else:
+                    failed += 1
+
+                pbar.update(1)
+    else:
+        log_queue = None
+        if use_llm:
+            logger.info(f"Using {workers} worker threads")
+            executor = ThreadPoolExecutor(max_workers=workers)
+        else:
+            logger.info(f"Using {workers} worker processes")
+            # Workers log through the parent so only it writes to the console
+            log_queue = multiprocessing.Queue()
+            executor = create_process_pool(workers, log_queue, md)
+
+        for f in islice(to_prefetch, workers + prefetch):
+            prefetch_file(f)
+
+        listener = None
+        try:
+            with executor:
+                # Submit before the progress bar starts its monitor thread, so
+                # forked workers are created from a single-threaded parent
+                if use_llm:
+                    futures = {executor.submit(convert_file, md, f, f.with_suffix('.md')): f for f in pending}
+                else:
+                    futures = {executor.submit(_convert_one, str(f)): f for f in pending}
+
+                if log_queue is not None:
+                    listener = QueueListener(log_queue, *logging.getLogger().handlers)
+                    listener.start()
+
+                try:
+                    with tqdm(total=len(pending), desc="Converting files", unit="file",
+                              mininterval=0.2, miniters=1, smoothing=0.1) as pbar:
+                        for future in as_completed(futures):
+                            input_file = futures[future]
+                            for f in islice(to_prefetch, 1):
+                                prefetch_file(f)
+
+                            pbar.set_postfix_str(input_file.name, refresh=False)
+
+                            try:
+                                ok = future.result()
+                            except Exception as e:
+                                logger.error("Failed to convert %s: %s", input_file, e)
+                                ok = False
+
+                            if ok:
+                                if input_file in file_stats:
+                                    record_conversion(cache, input_file, file_stats[input_file], use_llm)
+                                successful += 1
+                            else:
+                                failed += 1
+
+                            pbar.update(1)
+                except BaseException:
+                    # Cancel queued files so an interrupt only waits for the
+                    # conversions already in progress. Wait here: the shutdown on
+                    # leaving the with block would otherwise clear the cancel
+                    # request before the process pool's manager thread sees it
+                    executor.shutdown(cancel_futures=True)
+                    raise
+        finally:
+            # Stopped after the pool has shut down, so all worker records are drained
+            if listener is not None:
+                listener.stop()
+
+    cache.close()
 
     # Print summary
     logger.info("="*70)
     logger.info("Conversion Summary")
     logger.info("="*70)
     logger.info(f"Total files processed: {len(files)}")
+    logger.info(f"Skipped (unchanged): {skipped}")
     logger.info(f"Successful conversions: {successful}")
     logger.info(f"Failed conversions: {failed}")
     logger.info(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")